@@ -4,9 +4,14 @@ Monitor SerpAPI usage and credits with alerts
 """
 
 import requests
+import json
+import os
 import logging
+import tempfile
+import time
 from typing import Dict, Optional
 from datetime import datetime
+from pathlib import Path
 
 try:
     from .ConfigManager import ConfigManager
@@ -19,20 +24,55 @@ logger = logging.getLogger(__name__)
 class SerpAPIMonitor:
     """Monitor SerpAPI account usage and credits"""
     
-    def __init__(self, config: ConfigManager = None):
-        """Initialize API monitor with configuration."""
+    def __init__(self, config: ConfigManager = None, cache_ttl: int = 60):
+        """
+        Initialize API monitor with configuration.
+
+        Args:
+            config: ConfigManager instance. If None, creates new instance.
+            cache_ttl: Seconds a cached credit status stays valid
+                (0 disables caching and always hits the API)
+        """
         if config is None:
             config = ConfigManager()
-        
+
         self.config = config
         self.api_key = config.get_api_key()
         self.account_url = "https://serpapi.com/account"
         self.timeout = config.get_request_timeout()
-        
+
         # Alert thresholds from config
         self.warning_threshold = config.get_api_warning_threshold()
         self.critical_threshold = config.get_api_critical_threshold()
-        
+
+        # Short-TTL disk cache so back-to-back runs don't re-hit the
+        # account endpoint on every invocation
+        self.cache_ttl = cache_ttl
+        self.cache_path = Path.home() / '.cache' / 'viincci' / 'credits.json'
+
+    def _load_cached_status(self) -> Optional[Dict]:
+        """Return the cached credit status if it is still fresh."""
+        if self.cache_ttl <= 0:
+            return None
+        try:
+            if time.time() - self.cache_path.stat().st_mtime <= self.cache_ttl:
+                with self.cache_path.open('r', encoding='utf-8') as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _save_cached_status(self, status: Dict) -> None:
+        """Atomically write the credit status to the disk cache."""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(status, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache credit status: {e}")
+
     def get_account_info(self) -> Optional[Dict]:
         """
         Fetch account information from SerpAPI.
@@ -67,6 +107,12 @@ class SerpAPIMonitor:
         Returns:
             Dictionary with credit status and alerts
         """
+        cached = self._load_cached_status()
+        if cached is not None:
+            if verbose:
+                self.print_status(cached)
+            return cached
+
         account_info = self.get_account_info()
         
         if not account_info:
@@ -121,9 +167,11 @@ class SerpAPIMonitor:
             "checked_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
         
+        self._save_cached_status(result)
+
         if verbose:
             self.print_status(result)
-        
+
         return result
     
     def print_status(self, status: Dict):
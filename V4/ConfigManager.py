@@ -7,6 +7,12 @@ import os
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
+# Optional C-level JSON parser for the config/domain metadata files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class ConfigManager:
     """
@@ -42,6 +48,7 @@ class ConfigManager:
         
         # Initialize all configurations
         self._configs = {}
+        self._domain_info_cache = {}
         self._load_all_configs()
     
     def _load_config(self, filename: str, default: Optional[Dict] = None) -> Dict:
@@ -50,12 +57,12 @@ class ConfigManager:
         
         if filepath.exists():
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                raw = filepath.read_bytes()
+                config = orjson.loads(raw) if orjson else json.loads(raw)
                 if self.verbose:
                     print(f"✓ Loaded {filename}")
                 return config
-            except json.JSONDecodeError as e:
+            except ValueError as e:
                 print(f"❌ Error parsing {filename}: {e}")
                 return default or {}
             except Exception as e:
@@ -72,8 +79,11 @@ class ConfigManager:
         """Save configuration to JSON file."""
         filepath = self.config_dir / filename
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+            if orjson:
+                filepath.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(config, f, indent=2)
             if self.verbose:
                 print(f"✓ Saved {filename}")
         except Exception as e:
@@ -92,6 +102,7 @@ class ConfigManager:
             "database_path": "v4/db/research_data.db",
             "device": "cpu",
             "load_in_8bit": False,
+            "index_type": "hnsw",
             "max_articles_per_run": 1,
             "search_config_path": "v4/config/search_config.json",
             "alternative_models": {
@@ -331,10 +342,17 @@ class ConfigManager:
         return self.domain
     
     def get_domain_info(self, domain: str = None) -> Dict:
-        """Get information about a specific domain."""
+        """Get information about a specific domain (cached per domain)."""
         domain = domain or self.domain
-        return self._configs['domains'].get(domain, {})
-    
+        info = self._domain_info_cache.get(domain)
+        if info is None:
+            info = self._configs['domains'].get(domain, {})
+            if info.get('keywords'):
+                # Precompute the display preview so CLI loops only do a lookup
+                info['_keyword_preview'] = ', '.join(info['keywords'][:5])
+            self._domain_info_cache[domain] = info
+        return info
+
     def get_available_domains(self) -> List[str]:
         """Get list of available research domains."""
         return list(self._configs['domains'].keys())
@@ -351,6 +369,7 @@ class ConfigManager:
         """
         if new_domain in self.get_available_domains():
             self.domain = new_domain
+            self._domain_info_cache.clear()  # Invalidate cached domain metadata
             self._load_domain_reliability()  # Reload domain-specific reliability
             if self.verbose:
                 print(f"✓ Switched to domain: {new_domain}")
@@ -416,6 +435,10 @@ class ConfigManager:
     
     def get_load_in_8bit(self) -> bool:
         return self._configs['ai_settings'].get('load_in_8bit', False)
+
+    def get_index_type(self) -> str:
+        """Get FAISS index type ('flat' exact search or 'hnsw' ANN)."""
+        return self._configs['ai_settings'].get('index_type', 'hnsw')
     
     def get_database_path(self) -> str:
         return self._configs['ai_settings'].get('database_path', 'v4/db/research_data.db')
@@ -9,6 +9,8 @@ import numpy as np
 from sentence_transformers import SentenceTransformer
 from transformers import AutoTokenizer, AutoModelForCausalLM, pipeline
 import torch
+import importlib.util
+from collections import OrderedDict
 from typing import List, Dict, Optional
 import logging
 try:
@@ -22,21 +24,24 @@ logger = logging.getLogger(__name__)
 class RAGSystem:
     """RAG System with configuration-driven setup"""
 
-    def __init__(self, config: ConfigManager = None):
+    def __init__(self, config: ConfigManager = None, index_type: str = None):
         """
         Initialize RAG system with configuration.
 
         Args:
             config: ConfigManager instance. If None, creates new instance.
+            index_type: FAISS index type: 'hnsw' (sublinear ANN search,
+                default) or 'flat' (exact L2 scan). If None, uses config value.
         """
         if config is None:
             config = ConfigManager()
-        
+
         self.config = config
         self.embedding_model_name = config.get_embedding_model()
         self.llm_model_name = config.get_llm_model()
         self.device = config.get_device()
         self.load_in_8bit = config.get_load_in_8bit()
+        self.index_type = index_type or config.get_index_type()
         
         print(f"Loading embedding model: {self.embedding_model_name}")
         self.embedding_model = SentenceTransformer(self.embedding_model_name)
@@ -46,6 +51,11 @@ class RAGSystem:
         self.texts = []
         self.metadata = []
         self.d = None
+
+        # Bounded LRU cache of query embeddings — repeated questions
+        # (multi-section generation, reruns) skip the encoder entirely
+        self._query_embedding_cache = OrderedDict()
+        self._query_cache_maxsize = 1024
         
         # LLM components (initialized by load_llm())
         self.tokenizer = None
@@ -56,29 +66,65 @@ class RAGSystem:
         logger.info(f"  LLM: {self.llm_model_name}")
         logger.info(f"  Device: {self.device}")
 
-    def load_llm(self, device: str = None, load_in_8bit: bool = None):
+    def load_llm(self, device: str = None, load_in_8bit: bool = None,
+                 quantization: str = None):
         """
         Load the LLM model.
 
         Args:
             device: Device to load model on. If None, uses config value.
             load_in_8bit: Whether to load in 8-bit. If None, uses config value.
+            quantization: Quantization mode ('none', 'int8' or 'nf4').
+                If None, falls back to the load_in_8bit setting. int8/nf4
+                need the bitsandbytes package (the 'all' extra) and cut the
+                weight footprint 2-4x, enabling RAG on ~8GB machines.
         """
         device = device or self.device
-        load_in_8bit = load_in_8bit if load_in_8bit is not None else self.load_in_8bit
+        if quantization is None:
+            load_in_8bit = load_in_8bit if load_in_8bit is not None else self.load_in_8bit
+            quantization = 'int8' if load_in_8bit else 'none'
 
         print(f"Loading LLM on device: {device}")
-        logger.info(f"Loading LLM: {self.llm_model_name}")
+        logger.info(f"Loading LLM: {self.llm_model_name} (quantization: {quantization})")
 
         self.tokenizer = AutoTokenizer.from_pretrained(self.llm_model_name)
+        if self.tokenizer.pad_token is None:
+            # Needed so query_batch can pad prompts into one batch
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+
+        model_kwargs = {}
+        if quantization != 'none':
+            # BitsAndBytesConfig imports fine without bitsandbytes — the
+            # missing package only blows up later inside pipeline(), so
+            # check for it explicitly before committing to quantization
+            if importlib.util.find_spec('bitsandbytes') is None:
+                logger.warning(
+                    "bitsandbytes not available; loading LLM without quantization. "
+                    "Install with: pip install viincci-rag[all]"
+                )
+                quantization = 'none'
+            else:
+                from transformers import BitsAndBytesConfig
+
+                if quantization == 'nf4':
+                    model_kwargs['quantization_config'] = BitsAndBytesConfig(
+                        load_in_4bit=True,
+                        bnb_4bit_quant_type='nf4',
+                        bnb_4bit_compute_dtype=torch.bfloat16,
+                        bnb_4bit_use_double_quant=True
+                    )
+                else:  # int8
+                    model_kwargs['quantization_config'] = BitsAndBytesConfig(
+                        load_in_8bit=True
+                    )
 
         self.generator = pipeline(
             "text-generation",
             model=self.llm_model_name,
             tokenizer=self.tokenizer,
-            device_map=device,
+            device_map='auto' if quantization != 'none' else device,
             torch_dtype=torch.float16 if torch.cuda.is_available() else torch.float32,
-            model_kwargs={"load_in_8bit": load_in_8bit} if load_in_8bit else {}
+            model_kwargs=model_kwargs
         )
 
         logger.info("LLM loaded successfully!")
@@ -95,21 +141,82 @@ class RAGSystem:
             texts: List of text chunks to index
             metadata: List of metadata dictionaries for each text
         """
+        texts = list(texts)  # Materialize in case a generator is passed
+
         print("Generating embeddings...")
         logger.info(f"Building index from {len(texts)} texts")
-        
-        embeddings = self.embedding_model.encode(texts, show_progress_bar=True)
+
+        # Encode the whole corpus in packed batches — one forward pass per
+        # batch instead of per text
+        embeddings = self.embedding_model.encode(
+            texts,
+            batch_size=64,
+            show_progress_bar=False,
+            convert_to_numpy=True
+        )
 
         self.texts = texts
         self.metadata = metadata
         self.d = embeddings.shape[1]
 
-        self.index = faiss.IndexFlatL2(self.d)
-        self.index.add(np.array(embeddings).astype('float32'))
+        self.index = self._create_index()
+        self.index.add(np.ascontiguousarray(embeddings, dtype=np.float32))
 
         logger.info(f"Index built with {self.index.ntotal} vectors")
         print(f"✓ Index built with {self.index.ntotal} vectors")
 
+    def _encode_queries(self, queries: List[str]) -> np.ndarray:
+        """
+        Encode queries to float32 embeddings with an LRU cache.
+
+        Cache misses are encoded together in one batch; hits cost a dict
+        lookup. The cache is bounded so long-running processes don't grow
+        without limit; eviction is deferred until the whole batch has been
+        assembled so it can never drop an entry this batch depends on.
+        """
+        cache = self._query_embedding_cache
+        embeddings = {}
+        misses = []
+        for query in queries:
+            if query in cache:
+                # Stash the hit now so later eviction can't pull it out
+                # from under this batch
+                cache.move_to_end(query)
+                embeddings[query] = cache[query]
+            elif query not in embeddings:
+                embeddings[query] = None
+                misses.append(query)
+
+        if misses:
+            encoded = self.embedding_model.encode(misses).astype('float32')
+            for query, embedding in zip(misses, encoded):
+                embeddings[query] = embedding
+                cache[query] = embedding
+
+        while len(cache) > self._query_cache_maxsize:
+            cache.popitem(last=False)
+
+        return np.stack([embeddings[query] for query in queries])
+
+    def _create_index(self):
+        """
+        Create an empty FAISS index of the configured type.
+
+        'hnsw' builds an IndexHNSWFlat whose graph search is O(log N) per
+        query; 'flat' keeps the exact O(N·d) L2 scan. Unknown types fall
+        back to flat with a warning.
+        """
+        if self.index_type == 'hnsw':
+            index = faiss.IndexHNSWFlat(self.d, 32)
+            index.hnsw.efConstruction = 200
+            index.hnsw.efSearch = 64
+            return index
+
+        if self.index_type != 'flat':
+            logger.warning(f"Unknown index_type '{self.index_type}', using flat L2")
+
+        return faiss.IndexFlatL2(self.d)
+
     def retrieve(self, query: str, k: int = 3) -> List[Dict]:
         """
         Retrieve top-k most relevant documents for a query.
@@ -124,16 +231,21 @@ class RAGSystem:
         if self.index is None:
             raise ValueError("Index not built. Call build_index() first.")
 
-        query_embedding = self.embedding_model.encode([query]).astype('float32')
+        query_embedding = self._encode_queries([query])
         distances, indices = self.index.search(query_embedding, k)
 
+        # Vectorize the per-document similarity transform instead of
+        # computing it scalar-by-scalar in the Python loop
+        dists = distances[0]
+        similarities = 1.0 / (1.0 + dists)
+
         results = []
         for i, idx in enumerate(indices[0]):
             results.append({
                 'text': self.texts[idx],
                 'metadata': self.metadata[idx],
-                'distance': float(distances[0][i]),
-                'similarity': float(1 / (1 + distances[0][i]))
+                'distance': float(dists[i]),
+                'similarity': float(similarities[i])
             })
 
         return results
@@ -213,6 +325,94 @@ class RAGSystem:
             'context': context
         }
 
+    def query_batch(self, questions: List[str], k: int = 5,
+                    max_new_tokens: int = 2000,
+                    temperature: float = 0.7) -> List[Dict]:
+        """
+        Answer several questions with one batched generation call.
+
+        Question embeddings are encoded together, retrieval runs as a single
+        FAISS search over all query vectors, and the prompts go through the
+        generator as one padded batch — one larger forward pass instead of
+        len(questions) small ones.
+
+        Args:
+            questions: List of user questions
+            k: Number of documents to retrieve per question
+            max_new_tokens: Maximum number of tokens to generate per answer
+            temperature: Sampling temperature for generation
+
+        Returns:
+            List of result dictionaries, one per question, in input order
+        """
+        if not self.is_llm_loaded():
+            error_msg = (
+                "LLM generator not loaded. Call load_llm() before using query_batch(). "
+                "This is required for Viincci-RAG to generate intelligent responses."
+            )
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        if not questions:
+            return []
+
+        if self.index is None:
+            raise ValueError("Index not built. Call build_index() first.")
+
+        logger.info(f"Processing batch of {len(questions)} queries")
+
+        # Step 1: Retrieve for all questions with one encode + one search
+        print(f"Retrieving top {k} documents for {len(questions)} questions...")
+        query_embeddings = self._encode_queries(list(questions))
+        distances, indices = self.index.search(query_embeddings, k)
+
+        # Step 2/3: Build context and prompt per question
+        prompts = []
+        batch_docs = []
+        for row, question in enumerate(questions):
+            dists = distances[row]
+            similarities = 1.0 / (1.0 + dists)
+            docs = []
+            for i, idx in enumerate(indices[row]):
+                docs.append({
+                    'text': self.texts[idx],
+                    'metadata': self.metadata[idx],
+                    'distance': float(dists[i]),
+                    'similarity': float(similarities[i])
+                })
+            batch_docs.append(docs)
+            prompts.append(self._create_prompt(question, self.generate_context(docs)))
+
+        # Step 4: One padded generation pass for the whole batch
+        print(f"Generating {len(prompts)} answers in one batch...")
+        try:
+            outputs = self.generator(
+                prompts,
+                max_new_tokens=max_new_tokens,
+                temperature=temperature,
+                do_sample=True if temperature > 0 else False,
+                top_p=0.95,
+                top_k=50,
+                return_full_text=False,
+                batch_size=len(prompts)
+            )
+            answers = [out[0]['generated_text'].strip() for out in outputs]
+        except Exception as e:
+            logger.error(f"Error generating batched answers: {str(e)}")
+            answers = [f"Error generating answer: {str(e)}"] * len(prompts)
+
+        results = []
+        for question, answer, docs in zip(questions, answers, batch_docs):
+            results.append({
+                'question': question,
+                'answer': answer,
+                'sources': [doc['metadata'] for doc in docs],
+                'retrieved_docs': docs,
+                'context': self.generate_context(docs)
+            })
+
+        return results
+
     def _create_prompt(self, question: str, context: str) -> str:
         """Create prompt for LLM."""
         prompt = f"""<s>[INST] You are a helpful assistant that answers questions based on the provided context.
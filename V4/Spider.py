@@ -5,8 +5,11 @@ Domain-agnostic web scraping system
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 from typing import List, Dict, Optional
 import json
@@ -30,13 +33,15 @@ class UniversalResearchSpider:
     Supports any research domain configured in domains.json
     """
 
-    def __init__(self, config: ConfigManager, check_credits: bool = True):
+    def __init__(self, config: ConfigManager, check_credits: bool = True,
+                 max_workers: int = 8):
         """
         Initialize spider with configuration and API monitoring.
-        
+
         Args:
             config: ConfigManager instance
             check_credits: Whether to check API credits before operations
+            max_workers: Number of concurrent content extraction workers
         """
         self.config = config
         self.domain = config.get_current_domain()
@@ -51,10 +56,20 @@ class UniversalResearchSpider:
         self.delay = config.get_search_delay()
         self.max_sources = config.get_max_sources()
         self.request_timeout = config.get_request_timeout()
+        self.max_workers = max_workers
         
-        # Session setup
+        # Session setup with connection pooling so SerpAPI and content
+        # fetches reuse Keep-Alive sockets instead of paying a fresh
+        # TCP+TLS handshake per request
         self.session = requests.Session()
         self.session.headers.update(config.get_request_headers())
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
         # Domain-specific settings
         self.domain_reliability = self._build_domain_reliability()
@@ -140,9 +155,9 @@ class UniversalResearchSpider:
                     "engine": "google"
                 }
                 
-                response = requests.get(
-                    "https://serpapi.com/search", 
-                    params=params, 
+                response = self.session.get(
+                    "https://serpapi.com/search",
+                    params=params,
                     timeout=self.request_timeout
                 )
                 response.raise_for_status()
@@ -522,33 +537,43 @@ class UniversalResearchSpider:
         search_results = self.search_serpapi(query_term)
         print(f"✓ Found {len(search_results)} potential sources\n")
         
-        # Extract content
+        # Extract content concurrently (network-bound, embarrassingly parallel)
         print("📄 Step 2: Extracting content...")
-        sources = []
+        candidates = []
         processed_domains = {}
-        
-        for i, result in enumerate(search_results[:self.max_sources], 1):
+
+        for result in search_results[:self.max_sources]:
             url = result['url']
             domain = urlparse(url).netloc
-            doc_type = result.get('doc_type', 'html')
-            
+
             # Limit per domain
             max_per_domain = 5 if 'edu' in domain or 'ac.' in domain else 3
             processed_domains[domain] = processed_domains.get(domain, 0)
-            
+
             if processed_domains[domain] >= max_per_domain:
                 continue
-            
-            print(f"  [{i}/{len(search_results)}] {result['title'][:60]}...")
-            
-            source = self.extract_content(url, doc_type)
-            
-            if source and len(source['text']) > 150:
-                sources.append(source)
-                processed_domains[domain] += 1
-                print(f"    ✓ Extracted from {domain}")
-            
-            time.sleep(self.delay)
+
+            processed_domains[domain] += 1
+            candidates.append(result)
+
+        def fetch(result):
+            # Each worker honors the configured delay between its own
+            # requests, so the crawl stays throttled per connection even
+            # though extraction runs concurrently
+            if self.delay:
+                time.sleep(self.delay)
+            return self.extract_content(result['url'], result.get('doc_type', 'html'))
+
+        sources = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            extracted = executor.map(fetch, candidates)
+
+            for i, (result, source) in enumerate(zip(candidates, extracted), 1):
+                print(f"  [{i}/{len(candidates)}] {result['title'][:60]}...")
+
+                if source and len(source['text']) > 150:
+                    sources.append(source)
+                    print(f"    ✓ Extracted from {urlparse(result['url']).netloc}")
         
         print(f"\n✓ Successfully extracted {len(sources)} sources")
         
@@ -8,6 +8,7 @@ __author__ = "MrViincciLeRoy"
 __email__ = "Viincci@proton.me"
 import sys
 import os
+import importlib
 
 # Windows encoding fix - MUST BE FIRST
 if sys.platform == 'win32':
@@ -19,24 +20,48 @@ if sys.platform == 'win32':
             pass
     os.environ['PYTHONIOENCODING'] = 'utf-8'
 
-# Core components
+# Lightweight core components (no torch/faiss/bs4 behind them)
 from V4.ConfigManager import ConfigManager
-from V4.FloraDatabase import FloraDatabase
-from V4.RagSys import RAGSystem
-from V4.UniversalArticleGenerator import UniversalArticleGenerator
-from V4.Spider import UniversalResearchSpider
 from V4.ApiMonitor import SerpAPIMonitor
 
-# Optional components (may fail if dependencies not installed)
-try:
-    from V4.ArtGenSys import EnhancedPlantArticleGenerator
-except ImportError:
-    EnhancedPlantArticleGenerator = None
+# Heavy components are loaded lazily (PEP 562) so metadata-only CLI
+# commands like --list-domains / --check-credits don't pay the
+# torch/faiss/sentence-transformers import cost.
+_LAZY_IMPORTS = {
+    'FloraDatabase': 'V4.FloraDatabase',
+    'RAGSystem': 'V4.RagSys',
+    'UniversalArticleGenerator': 'V4.UniversalArticleGenerator',
+    'UniversalResearchSpider': 'V4.Spider',
+}
+
+# Optional components (may fail if dependencies not installed);
+# resolve to None on ImportError, like the old eager behavior
+_OPTIONAL_IMPORTS = {
+    'EnhancedPlantArticleGenerator': 'V4.ArtGenSys',
+    'FloraWikipediaScraper': 'V4.FloraWikipediaScraper',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name])
+        value = getattr(module, name)
+    elif name in _OPTIONAL_IMPORTS:
+        try:
+            module = importlib.import_module(_OPTIONAL_IMPORTS[name])
+            value = getattr(module, name)
+        except ImportError:
+            value = None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(__all__) | set(globals()))
 
-try:
-    from V4.FloraWikipediaScraper import FloraWikipediaScraper
-except ImportError:
-    FloraWikipediaScraper = None
 
 __all__ = [
     '__version__',
@@ -5,17 +5,20 @@ This module is part of the V4 package and provides the command-line interface
 """
 
 import argparse
+import functools
+import hashlib
 import sys
 import json
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
 
+# Only lightweight modules at import time; the heavy research stack
+# (spider, RAG, article generator) is imported inside perform_research so
+# metadata-only commands (--list-domains, --domain-info, --check-credits)
+# start without the torch/faiss/bs4 import cost.
 from V4.ConfigManager import ConfigManager
-from V4.Spider import UniversalResearchSpider
 from V4.ApiMonitor import SerpAPIMonitor
-from V4.RagSys import RAGSystem
-from V4.UniversalArticleGenerator import UniversalArticleGenerator
 
 
 class OutputFormatter:
@@ -108,7 +111,7 @@ Generated: {metadata.get('date', datetime.now().strftime('%Y-%m-%d'))}
 class CreativeWriter:
     """Generate creative content like poems and essays"""
     
-    def __init__(self, config: ConfigManager, rag_system: Optional[RAGSystem] = None):
+    def __init__(self, config: ConfigManager, rag_system: Optional["RAGSystem"] = None):
         self.config = config
         self.rag_system = rag_system
     
@@ -156,15 +159,16 @@ To generate actual poems, use --rag flag and ensure research data is available.
             intro = self.rag_system.query(intro_prompt, k=5, max_new_tokens=300)
             sections.append(f"<h2>Introduction</h2>\n<p>{intro['answer']}</p>")
             
-            # Body paragraphs
+            # Body paragraphs — answered in one batched generation call
+            # instead of three sequential LLM passes
             body_prompts = [
                 f"Discuss the main aspects and characteristics of {topic}.",
                 f"Analyze the significance and implications of {topic}.",
                 f"Explore different perspectives or applications related to {topic}."
             ]
-            
-            for i, prompt in enumerate(body_prompts, 1):
-                result = self.rag_system.query(prompt, k=5, max_new_tokens=300)
+
+            body_results = self.rag_system.query_batch(body_prompts, k=5, max_new_tokens=300)
+            for i, result in enumerate(body_results, 1):
                 sections.append(f"<h2>Body Paragraph {i}</h2>\n<p>{result['answer']}</p>")
             
             # Conclusion
@@ -190,21 +194,22 @@ def list_domains(config: ConfigManager):
     print("🌐 Available Research Domains")
     print("="*70 + "\n")
     
+    current_domain = config.get_current_domain()
     for domain in config.get_available_domains():
         info = config.get_domain_info(domain)
-        current = " ⭐ (CURRENT)" if domain == config.get_current_domain() else ""
+        current = " ⭐ (CURRENT)" if domain == current_domain else ""
         
         print(f"🔹 {domain}{current}")
         print(f"   {info.get('description', 'No description')}")
-        keywords = info.get('keywords', [])
-        if keywords:
-            print(f"   Keywords: {', '.join(keywords[:5])}")
+        keyword_preview = info.get('_keyword_preview')
+        if keyword_preview:
+            print(f"   Keywords: {keyword_preview}")
         print()
 
 
-def check_credits(config: ConfigManager):
+def check_credits(config: ConfigManager, cache_ttl: int = 60):
     """Check SerpAPI credits."""
-    monitor = SerpAPIMonitor(config)
+    monitor = SerpAPIMonitor(config, cache_ttl=cache_ttl)
     status = monitor.check_credits(verbose=True)
     return status['can_proceed']
 
@@ -241,9 +246,29 @@ def show_domain_info(domain: str, config: ConfigManager):
     print("\n" + "="*70 + "\n")
 
 
+def _rag_index_cache_path(domain: str, query: str, sources: List[Dict]) -> Path:
+    """Cache path for a FAISS index built from these exact sources.
+
+    The key hashes the URLs in source order: the cached vectors are
+    paired positionally with this run's texts/metadata on load, so a
+    reordered source list must miss and rebuild rather than silently
+    mismatch vectors and texts.
+    """
+    urls = [s['metadata'].get('url', '') for s in sources]
+    key = hashlib.blake2b(
+        f"{domain}|{query}|{'|'.join(urls)}".encode('utf-8'),
+        digest_size=16
+    ).hexdigest()
+    return Path('.cache') / 'rag' / f"{key}.faiss"
+
+
 def perform_research(args, config: ConfigManager):
     """Perform research and generate output"""
-    
+    # Heavy imports deferred to here — only research runs pay for them
+    from V4.Spider import UniversalResearchSpider
+    from V4.RagSys import RAGSystem
+    from V4.UniversalArticleGenerator import UniversalArticleGenerator
+
     print(f"\n🔍 Starting research...")
     print(f"   Query: {args.query}")
     print(f"   Domain: {args.domain}")
@@ -275,8 +300,22 @@ def perform_research(args, config: ConfigManager):
             rag_system = RAGSystem(config)
             texts = [s['text'] for s in sources]
             metadata = [s['metadata'] for s in sources]
-            rag_system.build_index(texts, metadata)
-            rag_system.load_llm()
+
+            # Reuse a previously built index for the same domain/query/sources
+            # so reruns skip re-embedding the corpus entirely
+            index_path = _rag_index_cache_path(args.domain, args.query, sources)
+            if index_path.exists():
+                print(f"♻️  Reusing cached FAISS index: {index_path}")
+                rag_system.load_index(str(index_path), texts, metadata)
+            else:
+                rag_system.build_index(texts, metadata)
+                try:
+                    index_path.parent.mkdir(parents=True, exist_ok=True)
+                    rag_system.save_index(str(index_path))
+                except Exception as e:
+                    print(f"⚠️  Could not cache FAISS index: {e}")
+
+            rag_system.load_llm(quantization=args.quant)
             print("✅ RAG system ready")
         except Exception as e:
             print(f"⚠️  RAG initialization failed: {e}")
@@ -353,20 +392,24 @@ def perform_research(args, config: ConfigManager):
         print(f"📁 Metadata: {meta_file}")
 
 
-def main():
-    """CLI entry point"""
-    parser = argparse.ArgumentParser(
-        description="Enhanced Universal Research System V4 - Multi-Format Output & Creative Writing",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Examples:
   viincci-research -q "Rosa rubiginosa" -d botany
   viincci-research -q "diabetes" -d medical --format text
   viincci-research -q "Impressionism" -d art_history --content-type essay --rag
   viincci-research --list-domains
         """
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once per process."""
+    parser = argparse.ArgumentParser(
+        description="Enhanced Universal Research System V4 - Multi-Format Output & Creative Writing",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
-    
+
     # Basic arguments
     parser.add_argument('-q', '--query', type=str, help='Research query/topic')
     parser.add_argument('-d', '--domain', type=str, default='botany', 
@@ -392,6 +435,10 @@ Examples:
     # Research options
     parser.add_argument('--rag', action='store_true',
                        help='Use RAG for intelligent generation')
+    parser.add_argument('--quant', type=str, choices=['none', 'int8', 'nf4'],
+                       default=None,
+                       help='LLM quantization mode (int8/nf4 need bitsandbytes; '
+                            'default: config load_in_8bit setting)')
     parser.add_argument('--fetch-images', action='store_true', default=True,
                        help='Fetch images from Wikimedia Commons')
     parser.add_argument('--no-credit-check', action='store_true',
@@ -408,12 +455,21 @@ Examples:
                        help='Show detailed domain information')
     parser.add_argument('--check-credits', action='store_true',
                        help='Check SerpAPI credit status')
+    parser.add_argument('--credits-ttl', type=int, default=60, metavar='SECONDS',
+                       help='Seconds to cache the credit status on disk '
+                            '(0 = always query the API; default: 60)')
     
     parser.add_argument('-v', '--verbose', action='store_true',
                        help='Verbose output')
-    
+
+    return parser
+
+
+def main():
+    """CLI entry point"""
+    parser = _get_parser()
     args = parser.parse_args()
-    
+
     # Initialize config
     try:
         config = ConfigManager(domain=args.domain, verbose=args.verbose)
@@ -431,7 +487,7 @@ Examples:
         return
     
     if args.check_credits:
-        can_proceed = check_credits(config)
+        can_proceed = check_credits(config, cache_ttl=args.credits_ttl)
         sys.exit(0 if can_proceed else 1)
     
     if not args.query:
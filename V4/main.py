@@ -13,12 +13,9 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 import logging
 
+# Only ConfigManager at import time; each command imports the modules it
+# actually needs so 'list' and 'stats' start without the heavy stack
 from V4.ConfigManager import ConfigManager
-from V4.Spider import UniversalResearchSpider
-from V4.RagSys import RAGSystem
-from V4.UniversalArticleGenerator import UniversalArticleGenerator
-from V4.ApiMonitor import SerpAPIMonitor
-from V4.FloraDatabase import FloraDatabase
 
 
 def main():
@@ -48,15 +45,18 @@ def main():
     
     elif args.command == 'research' and args.query:
         print(f"\n🔍 Researching: {args.query}")
+        from V4.Spider import UniversalResearchSpider
         spider = UniversalResearchSpider(config)
         sources = spider.research(args.query)
         print(f"✅ Found {len(sources)} sources")
-    
+
     elif args.command == 'workflow' and args.query:
         print(f"\n🚀 Full workflow for: {args.query}")
+        from V4.Spider import UniversalResearchSpider
+        from V4.UniversalArticleGenerator import UniversalArticleGenerator
         spider = UniversalResearchSpider(config)
         sources = spider.research(args.query)
-        
+
         generator = UniversalArticleGenerator(config)
         article = generator.generate_full_article(args.query, sources)
         
@@ -68,6 +68,7 @@ def main():
         print(f"✅ Saved to: {filename}")
     
     elif args.command == 'stats':
+        from V4.FloraDatabase import FloraDatabase
         db = FloraDatabase(config)
         stats = db.get_statistics()
         print("\nDatabase Statistics:")
@@ -7,12 +7,61 @@ This script:
 2. Uses real SerpAPI to research Leonardo da Vinci
 3. Formats and saves output
 4. Optionally generates with library (if memory permits)
+
+SerpAPI responses are cached on disk under .cache/serpapi/ so reruns of the
+same query cost zero API credits. Pass --force-refresh to bypass the cache.
 """
 
+import hashlib
+import json
 import os
 import sys
 from pathlib import Path
 
+# orjson decodes/encodes the ~100KB SerpAPI payloads several times faster
+# than stdlib json; fall back silently when not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# On-disk SerpAPI response cache (keyed by query + engine + num)
+CACHE_DIR = Path(__file__).parent / '.cache' / 'serpapi'
+
+
+def get_cache_path(params: dict) -> Path:
+    """Build cache file path from the search parameters (API key excluded)."""
+    key = f"{params.get('q', '')}|{params.get('engine', 'google')}|{params.get('num', 10)}"
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{digest}.json"
+
+
+def load_cached_results(cache_path: Path) -> dict:
+    """Load cached SerpAPI results, or None if not cached."""
+    if cache_path.exists():
+        try:
+            raw = cache_path.read_bytes()
+            return orjson.loads(raw) if orjson else json.loads(raw)
+        except Exception as e:
+            print(f"⚠️  Could not read cache {cache_path}: {e}")
+    return None
+
+
+def save_cached_results(cache_path: Path, results: dict) -> None:
+    """Save SerpAPI results to the on-disk cache."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        if orjson:
+            cache_path.write_bytes(orjson.dumps(results))
+        else:
+            with cache_path.open('w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False)
+    except Exception as e:
+        print(f"⚠️  Could not write cache {cache_path}: {e}")
+
+
+FORCE_REFRESH = '--force-refresh' in sys.argv
+
 # Load environment from .env file
 from dotenv import load_dotenv
 env_path = Path(__file__).parent / '.env'
@@ -36,74 +85,91 @@ try:
     query = "Leonardo da Vinci biography Renaissance artist scientist inventions"
     print(f"\n🔍 Searching: {query}")
     
-    # Configure and execute search
+    # Configure and execute search (cached on disk to save API credits)
     params = {
         "q": query,
         "api_key": SERP_API_KEY,
         "engine": "google",
         "num": 10
     }
-    search_client = GoogleSearch(params)
-    results = search_client.get_dict()
-    
+    cache_path = get_cache_path(params)
+    results = None if FORCE_REFRESH else load_cached_results(cache_path)
+
+    if results is not None:
+        print(f"✓ Using cached SerpAPI results ({cache_path})")
+    else:
+        search_client = GoogleSearch(params)
+        results = search_client.get_dict()
+        if "organic_results" in results:
+            save_cached_results(cache_path, results)
+
     if "organic_results" in results:
         search_results = results["organic_results"]
         print(f"✓ Found {len(search_results)} results from SerpAPI")
         
-        # Extract text snippets
-        snippets = []
-        for i, result in enumerate(search_results[:8], 1):
-            title = result.get('title', 'Untitled')
-            snippet = result.get('snippet', '')
-            link = result.get('link', '')
-            if snippet:  # Only include results with content
-                snippets.append({
-                    'title': title,
-                    'text': snippet,
-                    'url': link,
-                    'rank': i
-                })
-                print(f"  {i}. {title[:70]}...")
+        # Extract text snippets — single comprehension for the data,
+        # separate loop for console I/O
+        snippets = [
+            {
+                'title': result.get('title', 'Untitled'),
+                'text': result['snippet'],
+                'url': result.get('link', ''),
+                'rank': i
+            }
+            for i, result in enumerate(search_results[:8], 1)
+            if result.get('snippet')  # Only include results with content
+        ]
+        for s in snippets:
+            print(f"  {s['rank']}. {s['title'][:70]}...")
         
         print(f"\n📝 Extracted {len(snippets)} snippets with content")
         
-        # Format article from search results
-        article = "# Leonardo da Vinci - Historical Overview\n\n"
-        article += f"**Research Query:** {query}\n\n"
-        article += f"**Sources:** {len(snippets)} web sources\n\n"
-        article += "---\n\n"
-        
+        # Format article from search results (collect parts, join once —
+        # repeated str += is quadratic for long articles)
+        parts = [
+            "# Leonardo da Vinci - Historical Overview\n\n",
+            f"**Research Query:** {query}\n\n",
+            f"**Sources:** {len(snippets)} web sources\n\n",
+            "---\n\n",
+        ]
+
         # Add introductory section
-        article += "## Overview\n\n"
+        parts.append("## Overview\n\n")
         if snippets:
-            article += f"{snippets[0]['text']}\n\n"
-        
+            parts.append(f"{snippets[0]['text']}\n\n")
+
         # Add detailed sections from other sources
-        article += "## Sources and References\n\n"
+        parts.append("## Sources and References\n\n")
         for i, s in enumerate(snippets[1:], 2):
-            article += f"### Source {i}: {s['title']}\n\n"
-            article += f"{s['text']}\n\n"
-            article += f"**[Read more]({s['url']})**\n\n"
-        
+            parts.append(f"### Source {i}: {s['title']}\n\n"
+                         f"{s['text']}\n\n"
+                         f"**[Read more]({s['url']})**\n\n")
+
         # Add metadata
-        article += "---\n\n"
-        article += "## Metadata\n\n"
-        article += f"- **Generated:** {__import__('datetime').datetime.now().isoformat()}\n"
-        article += f"- **Query:** {query}\n"
-        article += f"- **Results:** {len(snippets)} sources\n"
-        article += f"- **Source:** SerpAPI + Viincci-RAG\n"
-        
-        # Save output
+        parts.append("---\n\n")
+        parts.append("## Metadata\n\n")
+        parts.append(f"- **Generated:** {__import__('datetime').datetime.now().isoformat()}\n")
+        parts.append(f"- **Query:** {query}\n")
+        parts.append(f"- **Results:** {len(snippets)} sources\n")
+        parts.append(f"- **Source:** SerpAPI + Viincci-RAG\n")
+
+        # Save output — stream the parts straight to disk so peak memory
+        # stays at one chunk instead of the joined article plus its bytes
         output_file = Path(__file__).parent / "da_vinci_history.txt"
-        output_file.write_text(article, encoding='utf-8')
+        with output_file.open('w', encoding='utf-8', buffering=1 << 16) as f:
+            f.writelines(parts)
+
         print(f"\n✅ Article saved to: {output_file}")
         print(f"📄 Content preview (first 1000 chars):")
         print("-" * 80)
-        print(article[:1000])
-        if len(article) > 1000:
+        with output_file.open('r', encoding='utf-8') as f:
+            preview = f.read(1000)
+            truncated = bool(f.read(1))
+        print(preview)
+        if truncated:
             print("\n... [truncated]")
         print("-" * 80)
-        print(f"\n📊 Total article length: {len(article):,} characters")
+        print(f"\n📊 Total article length: {output_file.stat().st_size:,} characters")
         
         # Try to import and use library if available
         print("\n🚀 Attempting to use Viincci-RAG library for enhanced generation...")
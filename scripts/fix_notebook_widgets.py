@@ -10,64 +10,117 @@ Otherwise it ensures `metadata.widgets['state']` exists (set to an empty dict by
 
 It will modify files in-place and print a short summary.
 """
+import os
 import sys
 import json
+import mmap
 from pathlib import Path
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson parses large output-heavy notebooks ~3x faster than stdlib json;
+# fall back silently when not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Directories that never contain user notebooks worth fixing — pruned
+# before recursion so they aren't even stat()-ed
+_SKIP_DIRS = frozenset({
+    '.git', '.ipynb_checkpoints', 'node_modules', '__pycache__',
+    '.venv', 'venv', '.tox', 'dist', 'build',
+})
+
+
+def _iter_notebooks(root):
+    """Yield .ipynb paths under root via os.scandir, pruning _SKIP_DIRS."""
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.ipynb'):
+                        yield Path(entry.path)
+        except OSError:
+            continue
 
 
 def fix_notebook(path: Path, remove_widgets: bool = False) -> bool:
     changed = False
-    with path.open('r', encoding='utf-8') as f:
-        try:
-            doc = json.load(f)
-        except Exception as e:
-            print(f"ERROR: could not parse {path}: {e}")
+    try:
+        # Fast path: most notebooks carry no widget metadata at all, so a
+        # byte scan for the key rejects them before paying for a JSON parse
+        if path.stat().st_size == 0:
             return False
-    meta = doc.get('metadata', {})
-    if 'widgets' in meta:
-        widgets = meta.get('widgets')
+        with path.open('rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b'"widgets"') == -1:
+                    return False
+                raw = mm[:]
+        doc = orjson.loads(raw) if orjson else json.loads(raw)
+    except Exception as e:
+        print(f"ERROR: could not parse {path}: {e}")
+        return False
+    # Bind the dict keys as locals so the cell loop below (thousands of
+    # iterations on generated notebooks) hits LOAD_FAST instead of
+    # re-resolving each string constant per iteration
+    META = 'metadata'
+    WIDGETS = 'widgets'
+    STATE = 'state'
+    # Dicts are mutated in place — no need to assign them back into doc/cell
+    meta = doc.get(META)
+    if meta and WIDGETS in meta:
+        widgets = meta[WIDGETS]
         if remove_widgets:
-            del meta['widgets']
-            doc['metadata'] = meta
+            del meta[WIDGETS]
+            changed = True
+        elif not isinstance(widgets, dict):
+            print(f"NOTE: metadata.widgets in {path} is not a dict; replacing with {{'state':{{}}}}")
+            meta[WIDGETS] = {STATE: {}}
+            changed = True
+        elif STATE not in widgets:
+            widgets[STATE] = {}
             changed = True
-        else:
-            # Ensure widgets is a dict and has 'state'
-            if not isinstance(widgets, dict):
-                print(f"NOTE: metadata.widgets in {path} is not a dict; replacing with {{'state':{{}}}}")
-                meta['widgets'] = {'state': {}}
-                doc['metadata'] = meta
-                changed = True
-            else:
-                if 'state' not in widgets:
-                    widgets['state'] = {}
-                    meta['widgets'] = widgets
-                    doc['metadata'] = meta
-                    changed = True
     # Also walk through cells and ensure widget metadata (rare)
-    for cell in doc.get('cells', []):
-        cell_meta = cell.get('metadata', {})
-        if 'widgets' in cell_meta:
-            widgets = cell_meta.get('widgets')
-            if remove_widgets:
-                del cell_meta['widgets']
-                cell['metadata'] = cell_meta
-                changed = True
-            else:
-                if not isinstance(widgets, dict):
-                    cell_meta['widgets'] = {'state': {}}
-                    cell['metadata'] = cell_meta
-                    changed = True
-                else:
-                    if 'state' not in widgets:
-                        widgets['state'] = {}
-                        cell_meta['widgets'] = widgets
-                        cell['metadata'] = cell_meta
-                        changed = True
+    for cell in doc.get('cells', ()):
+        cell_meta = cell.get(META)
+        if not cell_meta or WIDGETS not in cell_meta:
+            continue
+        widgets = cell_meta[WIDGETS]
+        if remove_widgets:
+            del cell_meta[WIDGETS]
+            changed = True
+        elif not isinstance(widgets, dict):
+            cell_meta[WIDGETS] = {STATE: {}}
+            changed = True
+        elif STATE not in widgets:
+            widgets[STATE] = {}
+            changed = True
     if changed:
-        # Write back safely
-        with path.open('w', encoding='utf-8') as f:
-            json.dump(doc, f, indent=2, ensure_ascii=False)
+        # Write back safely — orjson's native indent formatter is far
+        # faster than stdlib json's and produces the same 2-space layout.
+        # Serialize the full payload first, then hand it to the kernel in
+        # one unbuffered write syscall; os.write releases the GIL, so the
+        # thread pool in main() overlaps these writes across files.
+        if orjson:
+            payload = orjson.dumps(doc, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        else:
+            payload = json.dumps(doc, indent=2, ensure_ascii=False).encode('utf-8')
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # write(2) may return short; loop so a partial write can't
+            # leave a truncated notebook behind
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
     return changed
 
 
@@ -82,22 +135,32 @@ def main(argv):
     for path in paths:
         pathp = Path(path)
         if pathp.is_dir():
-            files.extend(sorted(pathp.rglob('*.ipynb')))
+            files.extend(sorted(_iter_notebooks(pathp)))
         elif pathp.is_file() and pathp.suffix == '.ipynb':
             files.append(pathp)
     if not files:
         print('No .ipynb files found to process.')
         return 0
+
+    def process_one(fpath):
+        try:
+            return fpath, fix_notebook(fpath, remove_widgets=args.remove_widgets), None
+        except Exception as e:
+            return fpath, False, e
+
+    # Per-file work is independent and I/O-bound, so fan it out across a
+    # thread pool instead of walking the list serially
     total = 0
     fixed = 0
-    for fpath in files:
-        total += 1
-        try:
-            if fix_notebook(fpath, remove_widgets=args.remove_widgets):
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for fpath, changed, error in executor.map(process_one, files):
+            total += 1
+            if error is not None:
+                print(f'Error processing {fpath}: {error}')
+            elif changed:
                 print(f'Fixed: {fpath}')
                 fixed += 1
-        except Exception as e:
-            print(f'Error processing {fpath}: {e}')
     print(f'Processed {total} .ipynb files, fixed: {fixed}')
     return 0
 
@@ -19,7 +19,33 @@ import types
 import tempfile
 import os
 import shutil
-import inspect
+
+# obj.__module__ -> defining file; avoids inspect.getsourcefile's
+# per-symbol filesystem walk when several symbols share a module
+_module_file_cache = {}
+
+
+def _srcfile(obj):
+    """Return the file an object was defined in via its __module__."""
+    mod = getattr(obj, '__module__', None)
+    if mod in _module_file_cache:
+        return _module_file_cache[mod]
+    src = getattr(sys.modules.get(mod), '__file__', None)
+    _module_file_cache[mod] = src
+    return src
+
+
+def _purge_modules(prefix: str):
+    """Drop every loaded module whose name starts with prefix.
+
+    Collects the victims in one comprehension instead of copying the whole
+    sys.modules key list before filtering it.
+    """
+    victims = [mod for mod in sys.modules if mod.startswith(prefix)]
+    for mod in victims:
+        del sys.modules[mod]
+        # A purged module may be re-imported from a different location
+        _module_file_cache.pop(mod, None)
 
 
 def report_loaded_symbols(module_name: str, symbols: list):
@@ -35,19 +61,15 @@ def report_loaded_symbols(module_name: str, symbols: list):
         if obj is None:
             print(f"  {s}: <not found>")
             continue
-        # If it's a class or function, try to locate its defining file
-        try:
-            src = inspect.getsourcefile(obj) or inspect.getfile(obj)
-        except TypeError:
-            src = getattr(obj, '__file__', None)
+        # If it's a class or function, locate its defining file via the
+        # module cache instead of inspect's filesystem lookups
+        src = _srcfile(obj) or getattr(obj, '__file__', None)
         print(f"  {s}: {obj} (defined in: {src})")
 
 
 def import_workspace_then_report():
     # Ensure workspace package is imported (prefer local files)
-    for mod in list(sys.modules.keys()):
-        if mod.startswith('viincci_rag'):
-            del sys.modules[mod]
+    _purge_modules('viincci_rag')
     print('\n=== Importing viincci_rag from workspace environment ===')
     report_loaded_symbols('viincci_rag', [
         'ConfigManager', 'RAGSystem', 'UniversalResearchSpider', 'UniversalArticleGenerator'
@@ -79,9 +101,7 @@ __all__ = ["ConfigManager", "RAGSystem", "UniversalResearchSpider", "UniversalAr
     sys.path.insert(0, tmpdir)
 
     # Remove any previously loaded viincci_rag modules
-    for mod in list(sys.modules.keys()):
-        if mod.startswith('viincci_rag'):
-            del sys.modules[mod]
+    _purge_modules('viincci_rag')
 
     try:
         report_loaded_symbols('viincci_rag', [
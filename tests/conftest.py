@@ -0,0 +1,12 @@
+"""Shared fixtures for the viincci_rag test suite"""
+import pytest
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Session-scoped ConfigManager so each test doesn't re-parse the config files"""
+    try:
+        from viincci_rag.core import ConfigManager
+        return ConfigManager(verbose=False)
+    except Exception as e:
+        pytest.skip(f"ConfigManager unavailable: {e}")
@@ -2,11 +2,10 @@
 import pytest
 
 
-def test_rag_system_initialization():
+def test_rag_system_initialization(config):
     """Test RAGSystem initializes correctly"""
     try:
-        from viincci_rag.core import RAGSystem, ConfigManager
-        config = ConfigManager(verbose=False)
+        from viincci_rag.core import RAGSystem
         rag = RAGSystem(config)
         assert rag.config is not None
         assert rag.embedding_model is not None
@@ -14,11 +13,10 @@ def test_rag_system_initialization():
         pytest.skip(f"RAGSystem unavailable: {e}")
 
 
-def test_rag_system_stats():
+def test_rag_system_stats(config):
     """Test RAGSystem statistics"""
     try:
-        from viincci_rag.core import RAGSystem, ConfigManager
-        config = ConfigManager(verbose=False)
+        from viincci_rag.core import RAGSystem
         rag = RAGSystem(config)
         stats = rag.get_statistics()
         assert "embedding_model" in stats
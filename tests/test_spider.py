@@ -2,11 +2,10 @@
 import pytest
 
 
-def test_spider_initialization():
+def test_spider_initialization(config):
     """Test UniversalResearchSpider initializes"""
     try:
-        from viincci_rag.core import UniversalResearchSpider, ConfigManager
-        config = ConfigManager(verbose=False)
+        from viincci_rag.core import UniversalResearchSpider
         spider = UniversalResearchSpider(config, check_credits=False)
         assert spider.config is not None
         assert spider.domain is not None
@@ -14,11 +13,10 @@ def test_spider_initialization():
         pytest.skip(f"Spider unavailable: {e}")
 
 
-def test_spider_api_check():
+def test_spider_api_check(config):
     """Test spider can check API status"""
     try:
-        from viincci_rag.core import UniversalResearchSpider, ConfigManager
-        config = ConfigManager(verbose=False)
+        from viincci_rag.core import UniversalResearchSpider
         spider = UniversalResearchSpider(config, check_credits=False)
         # Should not crash even without API key
         assert spider.api_monitor is None  # check_credits=False
@@ -17,52 +17,38 @@ __author_email__ = "Viincci@proton.me"
 __license__ = "MIT"
 
 
-# Import V4 classes and create viincci_rag subclasses (canonical namespace)
-try:
-    from V4 import (
-        ConfigManager as _V4ConfigManager,
-        FloraDatabase as _V4FloraDatabase,
-        RAGSystem as _V4RAGSystem,
-        UniversalArticleGenerator as _V4UniversalArticleGenerator,
-        UniversalResearchSpider as _V4UniversalResearchSpider,
-        SerpAPIMonitor as _V4SerpAPIMonitor,
-    )
-    
-    # Lightweight subclasses: inherit V4 functionality, show viincci_rag namespace
-    class ConfigManager(_V4ConfigManager):
-        """ConfigManager — viincci_rag canonical class."""
-        pass
-    
-    class FloraDatabase(_V4FloraDatabase):
-        """FloraDatabase — viincci_rag canonical class."""
-        pass
-    
-    class RAGSystem(_V4RAGSystem):
-        """RAGSystem — viincci_rag canonical class."""
-        pass
-    
-    class UniversalArticleGenerator(_V4UniversalArticleGenerator):
-        """UniversalArticleGenerator — viincci_rag canonical class."""
-        pass
-    
-    class UniversalResearchSpider(_V4UniversalResearchSpider):
-        """UniversalResearchSpider — viincci_rag canonical class."""
-        pass
-    
-    class SerpAPIMonitor(_V4SerpAPIMonitor):
-        """SerpAPIMonitor — viincci_rag canonical class."""
-        pass
+# Re-export the V4 classes under the viincci_rag namespace. Plain aliases
+# (not empty subclasses) keep isinstance checks and attribute lookups on
+# the V4 classes themselves, so both import paths see the same types.
+# Resolution is lazy (PEP 562): V4 is only imported on first attribute
+# access, so `import viincci_rag` alone never loads the heavy stack.
+_LAZY_IMPORTS = frozenset({
+    "ConfigManager",
+    "FloraDatabase",
+    "RAGSystem",
+    "UniversalArticleGenerator",
+    "UniversalResearchSpider",
+    "SerpAPIMonitor",
+})
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        try:
+            import V4
+            value = getattr(V4, name)
+        except Exception as e:
+            # Fallback if V4 not available
+            import warnings
+            warnings.warn(f"Failed to import V4 classes: {e}")
+            value = None
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-except Exception as e:
-    # Fallback if V4 not available
-    import warnings
-    warnings.warn(f"Failed to import V4 classes: {e}")
-    ConfigManager = None
-    FloraDatabase = None
-    RAGSystem = None
-    UniversalArticleGenerator = None
-    UniversalResearchSpider = None
-    SerpAPIMonitor = None
+def __dir__():
+    return sorted(set(globals()) | _LAZY_IMPORTS)
 
 
 __all__ = [
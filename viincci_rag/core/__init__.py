@@ -2,14 +2,20 @@
 
 This package re-exports core modules from the legacy `V4` package so
 imports like `from viincci_rag.core.rag_system import RAGSystem` continue
-to work.
+to work. Re-exports are resolved lazily (PEP 562) so importing
+`viincci_rag.core` does not drag in the heavy V4 dependency stack.
 """
 
-from .rag_system import RAGSystem
-from .spider import UniversalResearchSpider
-from .config import ConfigManager
-from .article_generator import UniversalArticleGenerator
-from .api_monitor import SerpAPIMonitor
+import importlib
+
+# name -> submodule providing it; resolved on first attribute access
+_LAZY_IMPORTS = {
+    "RAGSystem": "viincci_rag.core.rag_system",
+    "UniversalResearchSpider": "viincci_rag.core.spider",
+    "ConfigManager": "viincci_rag.core.config",
+    "UniversalArticleGenerator": "viincci_rag.core.article_generator",
+    "SerpAPIMonitor": "viincci_rag.core.api_monitor",
+}
 
 __all__ = [
     "RAGSystem",
@@ -18,3 +24,16 @@ __all__ = [
     "UniversalArticleGenerator",
     "SerpAPIMonitor",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name])
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -0,0 +1,36 @@
+"""Shared lazy re-export machinery for the viincci_rag wrapper modules.
+
+The core and database wrapper modules all do the same thing: expose one
+legacy V4 class under the viincci_rag namespace, importing V4 only on
+first access and handing back a RuntimeError-raising stub when the V4
+import fails. `lazy_reexport` builds that per-module __getattr__ once,
+instead of copy-pasting the template across six files.
+"""
+import importlib
+
+
+def lazy_reexport(v4_module, name, module_globals):
+    """Build a PEP 562 ``__getattr__`` re-exporting ``name`` from ``v4_module``.
+
+    Args:
+        v4_module: Dotted path of the legacy module, e.g. ``"V4.RagSys"``.
+        name: Class name to re-export, e.g. ``"RAGSystem"``.
+        module_globals: The calling module's ``globals()``, used to cache
+            the resolved class so later accesses skip this function.
+
+    Returns:
+        A function suitable for assignment to the module's ``__getattr__``.
+    """
+    def __getattr__(attr):
+        if attr == name:
+            try:
+                value = getattr(importlib.import_module(v4_module), name)
+            except Exception:  # pragma: no cover - fallback stub
+                def _unavailable(self, *args, **kwargs):
+                    raise RuntimeError(f"{name} is unavailable. Import of {v4_module} failed.")
+                value = type(name, (), {'__init__': _unavailable})
+            module_globals[name] = value
+            return value
+        raise AttributeError(f"module {module_globals['__name__']!r} has no attribute {attr!r}")
+
+    return __getattr__
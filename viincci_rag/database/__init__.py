@@ -1,25 +1,10 @@
 """Viincci-RAG Database adapters — canonical import path.
 
-Provides wrappers for database adapters. Exports FloraDatabase as a viincci_rag-owned
-class that inherits from V4, making viincci_rag the primary import path while maintaining
-backward compatibility with the legacy V4 package.
+Lazily re-exports the legacy V4.FloraDatabase; see ``core._wrapper`` for
+the shared resolution and fallback machinery.
 """
+from viincci_rag.core._wrapper import lazy_reexport
 
-try:
-    from V4.FloraDatabase import FloraDatabase as _V4FloraDatabase  # type: ignore
-    
-    class FloraDatabase(_V4FloraDatabase):  # type: ignore
-        """FloraDatabase for viincci_rag (inherits from V4.FloraDatabase).
-        
-        This is the canonical FloraDatabase for the viincci_rag package.
-        It extends the V4 implementation without changing its behavior,
-        making viincci_rag the primary import path.
-        """
-        pass
-
-except Exception:  # pragma: no cover
-    class FloraDatabase:  # type: ignore
-        def __init__(self, *args, **kwargs):
-            raise RuntimeError("FloraDatabase is unavailable.")
+__getattr__ = lazy_reexport('V4.FloraDatabase', 'FloraDatabase', globals())
 
 __all__ = ["FloraDatabase"]